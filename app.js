@@ -1,16 +1,16 @@
 const express = require('express');
 const cors = require('cors');
 const helmet = require('helmet');
-const morgan = require('morgan');
 const compression = require('compression');
-require('dotenv').config();
-
-//Swagger imports
-const swaggerUi = require('swagger-ui-express');
-const swaggerJsdoc = require('swagger-jsdoc');
+const settings = require('./config/settings');
+const { requestLogger } = require('./middlewares/requestLogger');
 
 const app = express();
 
+// API responses are dynamic JSON; skip hashing every response body for a
+// weak ETag (static uploads keep their own ETags via express.static)
+app.set('etag', false);
+
 //SECURITY MIDDLEWARE
 app.use(helmet({
   contentSecurityPolicy: {
@@ -25,8 +25,8 @@ app.use(helmet({
 
 //CORS CONFIGURATION
 app.use(cors({
-  origin: process.env.NODE_ENV === 'production' 
-    ? (process.env.CORS_ORIGIN ? process.env.CORS_ORIGIN.split(',') : [])
+  origin: settings.IS_PRODUCTION
+    ? settings.CORS_ORIGINS
     : ['http://localhost:3000', 'http://localhost:3001'],
   credentials: true,
   methods: ['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS'],
@@ -34,12 +34,14 @@ app.use(cors({
 }));
 
 //LOGGING & COMPRESSION
-app.use(morgan(process.env.NODE_ENV === 'production' ? 'combined' : 'dev'));
+app.use(requestLogger);
 app.use(compression());
 
 //BODY PARSING MIDDLEWARE
-app.use(express.json({ limit: '10mb' }));
-app.use(express.urlencoded({ extended: true, limit: '10mb' }));
+// Images arrive as multipart uploads (multer), so JSON/form bodies stay small;
+// a tight limit bounds the synchronous parse cost of any single request
+app.use(express.json({ limit: '1mb' }));
+app.use(express.urlencoded({ extended: false, limit: '1mb' }));
 
 //STATIC FILE SERVING
 app.use('/uploads', express.static('uploads'));
@@ -56,7 +58,7 @@ const swaggerOptions = {
     servers: [
       {
         // Use an environment variable for the server URL
-        url: process.env.API_URL || 'http://localhost:5000',
+        url: settings.API_URL,
       },
     ],
   },
@@ -64,8 +66,23 @@ const swaggerOptions = {
   apis: ['./routes/*.js'],
 };
 
-const swaggerSpec = swaggerJsdoc(swaggerOptions);
-app.use('/api-docs', swaggerUi.serve, swaggerUi.setup(swaggerSpec));
+// swagger-jsdoc parses the JSDoc of every route file and swagger-ui-express
+// loads the UI bundle, so both are deferred to the first /api-docs request;
+// workers that never serve docs skip the startup time and memory
+let swaggerRouter = null;
+app.use('/api-docs', (req, res, next) => {
+  if (!swaggerRouter) {
+    const swaggerUi = require('swagger-ui-express');
+    const swaggerJsdoc = require('swagger-jsdoc');
+
+    // Only memoize a fully built router: if spec generation throws, the
+    // error reaches the error handler now and the next request retries
+    const router = express.Router();
+    router.use(swaggerUi.serve, swaggerUi.setup(swaggerJsdoc(swaggerOptions)));
+    swaggerRouter = router;
+  }
+  swaggerRouter(req, res, next);
+});
 
 //API ROUTES
 const apiRoutes = require('./routes');
@@ -181,14 +198,14 @@ app.use((error, req, res, next) => {
     return res.status(503).json({
       success: false,
       message: 'Database connection error',
-      error: process.env.NODE_ENV === 'development' ? error.message : 'Service temporarily unavailable'
+      error: settings.IS_DEVELOPMENT ? error.message : 'Service temporarily unavailable'
     });
   }
 
   res.status(error.status || 500).json({
     success: false,
     message: error.message || 'Internal server error',
-    ...(process.env.NODE_ENV === 'development' && { stack: error.stack })
+    ...(settings.IS_DEVELOPMENT && { stack: error.stack })
   });
 });
 
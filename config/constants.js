@@ -0,0 +1,27 @@
+/**
+ * 📋 DOMAIN CONSTANTS
+ * Allowed values for enumerated fields, shared by models and validators.
+ * Arrays are frozen for ENUM definitions and express-validator isIn();
+ * the matching Sets give constant-time membership checks at runtime.
+ */
+
+const GENDERS = Object.freeze(['Male', 'Female', 'Other']);
+const DIETARY_PREFERENCES = Object.freeze(['veg', 'vegan', 'keto', 'paleo', 'gluten_free', 'dairy_free', 'none']);
+const HEALTH_GOALS = Object.freeze(['lose_weight', 'gain_muscle', 'maintain', 'improve_health']);
+const ACTIVITY_LEVELS = Object.freeze(['sedentary', 'light', 'moderate', 'active', 'very_active']);
+
+const RECOMMENDATIONS = Object.freeze(['excellent', 'good', 'moderate', 'avoid']);
+const SCAN_METHODS = Object.freeze(['barcode', 'image', 'manual', 'search']);
+
+module.exports = {
+  GENDERS,
+  DIETARY_PREFERENCES,
+  HEALTH_GOALS,
+  ACTIVITY_LEVELS,
+  RECOMMENDATIONS,
+  SCAN_METHODS,
+
+  DIETARY_PREFERENCE_SET: new Set(DIETARY_PREFERENCES),
+  HEALTH_GOAL_SET: new Set(HEALTH_GOALS),
+  ACTIVITY_LEVEL_SET: new Set(ACTIVITY_LEVELS)
+};
@@ -1,4 +1,3 @@
-const { Sequelize } = require('sequelize');
 require('dotenv').config();
 
 const config = {
@@ -51,28 +50,24 @@ const config = {
   }
 };
 
-// Test database connection function
+// Test database connection and warm the shared pool used by the models.
+// Opening the pool's minimum connections up front keeps TCP/TLS handshakes
+// off the first requests after a deploy.
 const testConnection = async () => {
   try {
-    const env = process.env.NODE_ENV || 'development';
-    const dbConfig = config[env];
-    
-    const sequelize = new Sequelize(
-      dbConfig.database,
-      dbConfig.username,
-      dbConfig.password,
-      {
-        host: dbConfig.host,
-        port: dbConfig.port,
-        dialect: dbConfig.dialect,
-        logging: false, // Disable logging for connection test
-        dialectOptions: dbConfig.dialectOptions
-      }
-    );
+    const { sequelize } = require('../models');
 
     await sequelize.authenticate();
-    console.log('✅ Database connection successful');
-    await sequelize.close();
+
+    const minConnections = (sequelize.options.pool && sequelize.options.pool.min) || 0;
+    if (minConnections > 1) {
+      // Concurrent queries force the pool to open distinct connections
+      await Promise.all(
+        Array.from({ length: minConnections }, () => sequelize.query('SELECT 1'))
+      );
+    }
+
+    console.log(`✅ Database connection successful (${Math.max(minConnections, 1)} pooled connection(s) ready)`);
     return true;
   } catch (error) {
     console.log('❌ Database connection failed:', error.message);
@@ -80,7 +75,14 @@ const testConnection = async () => {
   }
 };
 
+// Close the shared pool so in-flight connections are released on shutdown
+const closeConnection = async () => {
+  const { sequelize } = require('../models');
+  await sequelize.close();
+};
+
 module.exports = {
   ...config,
-  testConnection
+  testConnection,
+  closeConnection
 };
\ No newline at end of file
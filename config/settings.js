@@ -0,0 +1,29 @@
+require('dotenv').config();
+
+/**
+ * ⚙️ APPLICATION SETTINGS
+ * Environment values resolved once at startup. process.env is backed by a
+ * native getter that is re-evaluated on every access, so request hot paths
+ * (token verification, error handling) read from this frozen object instead.
+ */
+const NODE_ENV = process.env.NODE_ENV;
+
+const settings = Object.freeze({
+  NODE_ENV,
+  ENVIRONMENT: NODE_ENV || 'development',
+  IS_PRODUCTION: NODE_ENV === 'production',
+  IS_DEVELOPMENT: NODE_ENV === 'development',
+
+  PORT: process.env.PORT || 5000,
+  // Must outlive the load balancer's idle timeout (60s on most LBs) so pooled
+  // upstream connections are reused instead of reset and re-handshaken
+  KEEP_ALIVE_TIMEOUT_MS: parseInt(process.env.KEEP_ALIVE_TIMEOUT_MS) || 65000,
+  API_URL: process.env.API_URL || 'http://localhost:5000',
+  CORS_ORIGINS: process.env.CORS_ORIGIN ? process.env.CORS_ORIGIN.split(',') : [],
+  LOG_LEVEL: process.env.LOG_LEVEL || 'info',
+
+  JWT_SECRET: process.env.JWT_SECRET,
+  JWT_EXPIRE: process.env.JWT_EXPIRE || '30d'
+});
+
+module.exports = settings;
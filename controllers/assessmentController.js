@@ -267,26 +267,34 @@ class AssessmentController {
       const assessments = [];
       const errors = [];
 
-      for (const product_id of product_ids) {
-        try {
-          const product = await Product.findByPk(product_id, {
-            include: [{ model: NutritionFact, as: 'nutrition' }]
-          });
+      // Load all requested products in one query
+      const products = await Product.findAll({
+        where: { id: product_ids },
+        include: [{ model: NutritionFact, as: 'nutrition' }]
+      });
+      const productsById = new Map(products.map(product => [product.id, product]));
 
-          if (!product) {
-            errors.push({ product_id, error: 'Product not found' });
-            continue;
-          }
+      const result = await this.assessmentService.assessProductsForUser(products, userId, scan_method);
 
-          const assessment = await this.assessmentService.assessProductForUser(product, userId);
-          assessments.push({
-            assessment: assessment.toSummary(),
-            product: product.toPublicObject()
-          });
+      // Report results in request order. Postgres returns UUIDs lowercased,
+      // so uppercase IDs from the request are normalized for the lookups
+      for (const product_id of product_ids) {
+        const product = productsById.get(product_id.toLowerCase());
+        if (!product) {
+          errors.push({ product_id, error: 'Product not found' });
+          continue;
+        }
 
-        } catch (error) {
-          errors.push({ product_id, error: error.message });
+        const assessment = result.assessments.get(product.id);
+        if (!assessment) {
+          errors.push({ product_id, error: result.errors.get(product.id) });
+          continue;
         }
+
+        assessments.push({
+          assessment: assessment.toSummary(),
+          product: product.toPublicObject()
+        });
       }
 
       res.status(200).json({
@@ -2,7 +2,6 @@ const ProductAssessmentService = require('../services/productAssessmentService')
 const HealthAnalyticsService = require('../services/healthAnalyticsService');
 const { Product, NutritionFact, UserProductAssessment, Category } = require('../models');
 const multer = require('multer');
-const path = require('path');
 
 // Configure multer for image uploads
 const storage = multer.memoryStorage();
@@ -1,6 +1,7 @@
 const userService = require('../services/userService');
 const { validationResult } = require('express-validator');
 const { User } = require('../models'); // Add User model import
+const { wantsNdjson, writeNdjson } = require('../utils/helpers/stream');
 
 class UserController {
   /**
@@ -225,27 +226,24 @@ class UserController {
           message: 'User not found'
         });
       }
+
+      // Clients sending "Accept: application/x-ndjson" get one check per line
+      if (wantsNdjson(req)) {
+        return await writeNdjson(res, userService.iterCompatibility(user, ingredients));
+      }
       
-      // Now we can safely call model instance methods
-      const allergyCheck = ingredients.map(ingredient => ({
-        ingredient,
-        hasAllergy: user.hasAllergy(ingredient)
-      }));
-      
-      // Check dietary compatibility
-      const dietaryCompatible = user.isCompatibleWith(ingredients);
+      const result = userService.checkCompatibility(user, ingredients);
       
       res.status(200).json({
         success: true,
         message: 'Compatibility check completed',
-        data: {
-          allergyChecks: allergyCheck,
-          dietaryCompatible,
-          overallCompatible: !allergyCheck.some(check => check.hasAllergy) && dietaryCompatible,
-          dietaryRestrictions: user.getDietaryRestrictions()
-        }
+        data: result
       });
     } catch (error) {
+      // A partially streamed body can't be replaced with an error payload
+      if (res.headersSent) {
+        return res.destroy(error);
+      }
       res.status(400).json({
         success: false,
         message: error.message
@@ -1,5 +1,6 @@
 const jwt = require('jsonwebtoken');
 const { User } = require('../models');
+const settings = require('../config/settings');
 
 /**
  * 🔐 ADMIN AUTHENTICATION MIDDLEWARE
@@ -18,10 +19,10 @@ const adminAuth = async (req, res, next) => {
     }
 
     // Verify JWT token
-    const decoded = jwt.verify(token, process.env.JWT_SECRET);
+    const decoded = jwt.verify(token, settings.JWT_SECRET);
     
-    // Fetch full user details including role
-    const user = await User.findByPk(decoded.userId);
+    // Fetch user identity and role
+    const user = await User.findForAuth(decoded.userId);
     
     if (!user) {
       return res.status(401).json({
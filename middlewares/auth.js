@@ -1,5 +1,6 @@
 const jwt = require('jsonwebtoken');
 const { User } = require('../models');
+const settings = require('../config/settings');
 
 /**
  * 🔐 JWT Authentication Middleware
@@ -18,10 +19,10 @@ const auth = async (req, res, next) => {
     }
 
     // Verify JWT token
-    const decoded = jwt.verify(token, process.env.JWT_SECRET);
+    const decoded = jwt.verify(token, settings.JWT_SECRET);
     
     // Find user by ID from token
-    const user = await User.findByPk(decoded.userId);
+    const user = await User.findForAuth(decoded.userId);
     
     if (!user) {
       return res.status(401).json({
@@ -76,8 +77,8 @@ const optionalAuth = async (req, res, next) => {
       return next(); // Continue without user
     }
 
-    const decoded = jwt.verify(token, process.env.JWT_SECRET);
-    const user = await User.findByPk(decoded.userId);
+    const decoded = jwt.verify(token, settings.JWT_SECRET);
+    const user = await User.findForAuth(decoded.userId);
     
     if (user && user.is_active) {
       req.user = { userId: user.id, email: user.email };
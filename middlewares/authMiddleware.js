@@ -1,5 +1,6 @@
 const jwt = require('jsonwebtoken');
 const { User } = require('../models');
+const settings = require('../config/settings');
 
 /**
  * 🔐 AUTHENTICATION MIDDLEWARE
@@ -23,10 +24,10 @@ const authenticateToken = async (req, res, next) => {
     }
 
     // Verify JWT token
-    const decoded = jwt.verify(token, process.env.JWT_SECRET);
+    const decoded = jwt.verify(token, settings.JWT_SECRET);
     
     // Find user by ID from token
-    const user = await User.findByPk(decoded.userId);
+    const user = await User.findForAuth(decoded.userId);
     
     if (!user) {
       return res.status(401).json({
@@ -89,8 +90,8 @@ const optionalAuth = async (req, res, next) => {
     }
 
     // Token provided, try to authenticate
-    const decoded = jwt.verify(token, process.env.JWT_SECRET);
-    const user = await User.findByPk(decoded.userId);
+    const decoded = jwt.verify(token, settings.JWT_SECRET);
+    const user = await User.findForAuth(decoded.userId);
     
     if (user && user.is_active) {
       req.user = {
@@ -128,10 +129,10 @@ const authenticateAdmin = async (req, res, next) => {
     }
 
     // Verify JWT token
-    const decoded = jwt.verify(token, process.env.JWT_SECRET);
+    const decoded = jwt.verify(token, settings.JWT_SECRET);
     
     // Find user by ID from token
-    const user = await User.findByPk(decoded.userId);
+    const user = await User.findForAuth(decoded.userId);
     
     if (!user) {
       return res.status(401).json({
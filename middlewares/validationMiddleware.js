@@ -1,5 +1,6 @@
 const { validationResult } = require('express-validator');
 const DOMPurify = require('isomorphic-dompurify');
+const { DIETARY_PREFERENCE_SET, HEALTH_GOAL_SET, ACTIVITY_LEVEL_SET } = require('../config/constants');
 
 /**
  * 🔍 VALIDATION MIDDLEWARE
@@ -57,24 +58,21 @@ const customValidations = {
    * Check if health goal is valid
    */
   isValidHealthGoal: (goal) => {
-    const validGoals = ['lose_weight', 'gain_muscle', 'maintain', 'improve_health'];
-    return validGoals.includes(goal);
+    return HEALTH_GOAL_SET.has(goal);
   },
 
   /**
    * Check if dietary preference is valid
    */
   isValidDietaryPreference: (preference) => {
-    const validPreferences = ['veg', 'vegan', 'keto', 'paleo', 'gluten_free', 'dairy_free', 'none'];
-    return validPreferences.includes(preference);
+    return DIETARY_PREFERENCE_SET.has(preference);
   },
 
   /**
    * Check if activity level is valid
    */
   isValidActivityLevel: (level) => {
-    const validLevels = ['sedentary', 'light', 'moderate', 'active', 'very_active'];
-    return validLevels.includes(level);
+    return ACTIVITY_LEVEL_SET.has(level);
   }
 };
 
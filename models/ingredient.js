@@ -1,6 +1,13 @@
 'use strict';
 const { Model, DataTypes } = require('sequelize');
 
+// Common allergens compiled once into a single alternation
+const COMMON_ALLERGENS = [
+  'milk', 'eggs', 'fish', 'shellfish', 'tree nuts', 'peanuts',
+  'wheat', 'soybeans', 'sesame'
+];
+const COMMON_ALLERGEN_PATTERN = new RegExp(COMMON_ALLERGENS.join('|'));
+
 module.exports = (sequelize) => {
   class Ingredient extends Model {
     /**
@@ -18,14 +25,7 @@ module.exports = (sequelize) => {
      * 🔍 UTILITY METHODS
      */
     isCommonAllergen() {
-      const commonAllergens = [
-        'milk', 'eggs', 'fish', 'shellfish', 'tree nuts', 'peanuts', 
-        'wheat', 'soybeans', 'sesame'
-      ];
-      
-      return commonAllergens.some(allergen => 
-        this.name.toLowerCase().includes(allergen.toLowerCase())
-      );
+      return COMMON_ALLERGEN_PATTERN.test(this.name.toLowerCase());
     }
 
     /**
@@ -87,8 +87,7 @@ module.exports = (sequelize) => {
     /**
      * 🏷️ CATEGORIZATION METHODS
      */
-    getHealthCategory() {
-      const score = this.calculateHealthScore();
+    getHealthCategory(score = this.calculateHealthScore()) {
       if (score >= 80) return 'Excellent';
       if (score >= 60) return 'Good';
       if (score >= 40) return 'Moderate';
@@ -100,10 +99,12 @@ module.exports = (sequelize) => {
      */
     toPublicObject() {
       const { createdAt, updatedAt, ...publicProduct } = this.toJSON();
+      // Score once and derive the category from it instead of rescoring
+      const healthScore = this.calculateHealthScore();
       return {
         ...publicProduct,
-        healthScore: this.calculateHealthScore(),
-        healthCategory: this.getHealthCategory(),
+        healthScore,
+        healthCategory: this.getHealthCategory(healthScore),
         nutritionHighlights: {
           highProtein: this.isHighProtein(),
           highFiber: this.isHighFiber(),
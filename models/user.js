@@ -1,6 +1,38 @@
 'use strict';
 const { Model } = require('sequelize');
 const bcrypt = require('bcryptjs');
+const { GENDERS, DIETARY_PREFERENCES, HEALTH_GOALS, ACTIVITY_LEVELS } = require('../config/constants');
+const { getAllergenMatcher } = require('../utils/helpers/ingredientMatcher');
+
+// Ingredients forbidden by each dietary preference. Each list is compiled
+// once into a single alternation so a check is one scan of the ingredient
+// text rather than one substring search per keyword.
+const DIETARY_RESTRICTIONS = {
+  veg: ['meat', 'chicken', 'beef', 'pork', 'fish', 'seafood'],
+  vegan: ['meat', 'chicken', 'beef', 'pork', 'fish', 'seafood', 'milk', 'egg', 'honey', 'cheese', 'butter', 'yogurt'],
+  keto: [], // Will check carbs in nutrition facts
+  paleo: ['grain', 'wheat', 'rice', 'corn', 'legume', 'bean', 'dairy'],
+  gluten_free: ['wheat', 'gluten', 'barley', 'rye', 'malt'],
+  dairy_free: ['milk', 'cheese', 'butter', 'yogurt', 'cream', 'lactose']
+};
+
+const DIETARY_RESTRICTION_PATTERNS = Object.freeze(
+  Object.fromEntries(
+    Object.entries(DIETARY_RESTRICTIONS)
+      .filter(([, keywords]) => keywords.length > 0)
+      .map(([preference, keywords]) => [preference, new RegExp(keywords.join('|'))])
+  )
+);
+
+// Display label per dietary preference (e.g. gluten_free -> "GLUTEN FREE"),
+// computed once instead of formatting the value on every profile response
+const DIETARY_PREFERENCE_LABELS = Object.freeze(
+  Object.fromEntries(
+    DIETARY_PREFERENCES
+      .filter(preference => preference !== 'none')
+      .map(preference => [preference, preference.replace('_', ' ').toUpperCase()])
+  )
+);
 
 module.exports = (sequelize, DataTypes) => {
   class User extends Model {
@@ -147,28 +179,45 @@ module.exports = (sequelize, DataTypes) => {
     hasAllergy(ingredient) {
       if (!this.allergies || this.allergies.length === 0) return false;
       
-      return this.allergies.some(allergy => 
-        ingredient.toLowerCase().includes(allergy.toLowerCase()) ||
-        allergy.toLowerCase().includes(ingredient.toLowerCase())
-      );
+      return getAllergenMatcher(this.allergies).matches(ingredient);
+    }
+
+    /**
+     * Check a whole ingredient list against the user's allergies.
+     * Uses the matcher compiled for this allergy list, shared across requests.
+     */
+    checkAllergies(ingredients) {
+      const matcher = getAllergenMatcher(this.allergies);
+
+      return ingredients.map(ingredient => ({
+        ingredient,
+        hasAllergy: matcher.matches(ingredient)
+      }));
+    }
+
+    /**
+     * Lazily yield the same checks as checkAllergies, one ingredient at a time
+     */
+    *iterAllergyChecks(ingredients) {
+      const matcher = getAllergenMatcher(this.allergies);
+
+      for (const ingredient of ingredients) {
+        yield { ingredient, hasAllergy: matcher.matches(ingredient) };
+      }
+    }
+
+    findAllergensIn(ingredientText) {
+      return getAllergenMatcher(this.allergies).findIn(ingredientText);
     }
 
     isCompatibleWith(ingredients) {
-      if (this.dietary_preferences === 'none') return true;
+      const pattern = DIETARY_RESTRICTION_PATTERNS[this.dietary_preferences];
+      if (!pattern) return true;
       
-      const ingredientText = ingredients.join(' ').toLowerCase();
-      
-      const restrictions = {
-        veg: ['meat', 'chicken', 'beef', 'pork', 'fish', 'seafood'],
-        vegan: ['meat', 'chicken', 'beef', 'pork', 'fish', 'seafood', 'milk', 'egg', 'honey', 'cheese', 'butter', 'yogurt'],
-        keto: [], // Will check carbs in nutrition facts
-        paleo: ['grain', 'wheat', 'rice', 'corn', 'legume', 'bean', 'dairy'],
-        gluten_free: ['wheat', 'gluten', 'barley', 'rye', 'malt'],
-        dairy_free: ['milk', 'cheese', 'butter', 'yogurt', 'cream', 'lactose']
-      };
-
-      const forbidden = restrictions[this.dietary_preferences] || [];
-      return !forbidden.some(item => ingredientText.includes(item));
+      // Accept the raw comma-separated ingredient text as well as a list, so
+      // callers holding product text don't split it only for it to be re-joined
+      const ingredientText = (Array.isArray(ingredients) ? ingredients.join(' ') : ingredients).toLowerCase();
+      return !pattern.test(ingredientText);
     }
 
     getDietaryRestrictions() {
@@ -178,8 +227,9 @@ module.exports = (sequelize, DataTypes) => {
         restrictions.push(...this.allergies.map(allergy => `Allergic to ${allergy}`));
       }
       
-      if (this.dietary_preferences !== 'none') {
-        restrictions.push(this.dietary_preferences.replace('_', ' ').toUpperCase());
+      const dietaryLabel = DIETARY_PREFERENCE_LABELS[this.dietary_preferences];
+      if (dietaryLabel) {
+        restrictions.push(dietaryLabel);
       }
       
       return restrictions;
@@ -358,6 +408,14 @@ static async findByEmail(email) {
   }
 }
 
+    static async findForAuth(id) {
+      // Auth middleware runs on every protected request and only needs
+      // identity/role columns, not the full health profile
+      return await this.findByPk(id, {
+        attributes: ['id', 'email', 'name', 'role', 'is_active']
+      });
+    }
+
     static async findActiveUsers() {
       return await this.findAll({
         where: { is_active: true }
@@ -456,7 +514,7 @@ static async findByEmail(email) {
       }
     },
     gender: {
-      type: DataTypes.ENUM('Male', 'Female', 'Other'),
+      type: DataTypes.ENUM(...GENDERS),
       allowNull: true
     },
     height: {
@@ -498,15 +556,15 @@ static async findByEmail(email) {
       comment: 'Array of current medications that may affect dietary choices'
     },
     dietary_preferences: {
-      type: DataTypes.ENUM('veg', 'vegan', 'keto', 'paleo', 'gluten_free', 'dairy_free', 'none'),
+      type: DataTypes.ENUM(...DIETARY_PREFERENCES),
       defaultValue: 'none'
     },
     health_goals: {
-      type: DataTypes.ENUM('lose_weight', 'gain_muscle', 'maintain', 'improve_health'),
+      type: DataTypes.ENUM(...HEALTH_GOALS),
       defaultValue: 'maintain'
     },
     activity_level: {
-      type: DataTypes.ENUM('sedentary', 'light', 'moderate', 'active', 'very_active'),
+      type: DataTypes.ENUM(...ACTIVITY_LEVELS),
       defaultValue: 'moderate'
     },
 
@@ -1,5 +1,14 @@
 'use strict';
 const { Model, DataTypes } = require('sequelize');
+const { RECOMMENDATIONS, SCAN_METHODS } = require('../config/constants');
+
+// Icon per recommendation value, looked up for every assessment in history lists
+const RECOMMENDATION_ICONS = Object.freeze({
+  excellent: '🟢',
+  good: '🔵',
+  moderate: '🟡',
+  avoid: '🔴'
+});
 
 module.exports = (sequelize) => {
   class UserProductAssessment extends Model {
@@ -24,13 +33,7 @@ module.exports = (sequelize) => {
      * 🎯 ASSESSMENT ANALYSIS METHODS
      */
     getRecommendationIcon() {
-      switch (this.recommendation) {
-        case 'excellent': return '🟢';
-        case 'good': return '🔵';
-        case 'moderate': return '🟡';
-        case 'avoid': return '🔴';
-        default: return '⚪';
-      }
+      return RECOMMENDATION_ICONS[this.recommendation] || '⚪';
     }
 
     getRiskLevel() {
@@ -138,7 +141,7 @@ module.exports = (sequelize) => {
     
     // Assessment Results
     recommendation: {
-      type: DataTypes.ENUM('excellent', 'good', 'moderate', 'avoid'),
+      type: DataTypes.ENUM(...RECOMMENDATIONS),
       allowNull: false,
       comment: 'Overall recommendation for this user'
     },
@@ -188,7 +191,7 @@ module.exports = (sequelize) => {
     
     // Scan Context
     scan_method: {
-      type: DataTypes.ENUM('barcode', 'image', 'manual', 'search'),
+      type: DataTypes.ENUM(...SCAN_METHODS),
       allowNull: false,
       comment: 'How the product was scanned/identified'
     },
@@ -4,6 +4,7 @@ const assessmentController = require('../controllers/assessmentController');
 const { authenticateToken } = require('../middlewares/authMiddleware');
 const { validateRequest } = require('../middlewares/validationMiddleware');
 const { body, query, param } = require('express-validator');
+const { RECOMMENDATIONS, SCAN_METHODS } = require('../config/constants');
 
 /**
  * 🔍 PRODUCT ASSESSMENT ROUTES
@@ -67,7 +68,7 @@ router.post('/',
       .isUUID()
       .withMessage('Valid product ID is required'),
     body('scan_method')
-      .isIn(['barcode', 'image', 'manual', 'search'])
+      .isIn(SCAN_METHODS)
       .withMessage('Valid scan method is required'),
     body('scan_location')
       .optional()
@@ -277,7 +278,7 @@ router.get('/user/history',
       .withMessage('Offset must be non-negative'),
     query('recommendation')
       .optional()
-      .isIn(['excellent', 'good', 'moderate', 'avoid'])
+      .isIn(RECOMMENDATIONS)
       .withMessage('Invalid recommendation filter')
   ],
   validateRequest,
@@ -484,7 +485,7 @@ router.post('/bulk',
       .isUUID()
       .withMessage('All product IDs must be valid UUIDs'),
     body('scan_method')
-      .isIn(['barcode', 'image', 'manual', 'search'])
+      .isIn(SCAN_METHODS)
       .withMessage('Valid scan method is required')
   ],
   validateRequest,
@@ -1,5 +1,6 @@
 const express = require('express');
 const router = express.Router();
+const settings = require('../config/settings');
 
 // Import route modules
 const userRoutes = require('./users');
@@ -10,6 +11,37 @@ const assessmentRoutes = require('./assessments');
  * 🚀 API ROUTE CONFIGURATION
  */
 
+// Static endpoint map, built once instead of on every request
+const API_ENDPOINTS = Object.freeze({
+  users: {
+    register: 'POST /api/users/register',
+    login: 'POST /api/users/login',
+    profile: 'GET /api/users/profile',
+    healthTips: 'GET /api/users/health-tips',
+    dietaryPreferences: 'GET /api/users/dietary-preferences'
+  },
+  products: {
+    scanBarcode: 'POST /api/products/scan/barcode',
+    scanImage: 'POST /api/products/scan/image',
+    search: 'GET /api/products/search',
+    getProduct: 'GET /api/products/:id',
+    getAssessment: 'GET /api/products/:id/assessment',
+    history: 'GET /api/products/history',
+    stats: 'GET /api/products/stats',
+    categories: 'GET /api/products/categories'
+  },
+  assessments: {
+    create: 'POST /api/assessments',
+    getById: 'GET /api/assessments/:id',
+    update: 'PUT /api/assessments/:id',
+    history: 'GET /api/assessments/user/history',
+    stats: 'GET /api/assessments/user/stats',
+    delete: 'DELETE /api/assessments/:id',
+    bulk: 'POST /api/assessments/bulk'
+  },
+  health: 'GET /api/health'
+});
+
 /**
  * @swagger
  * /api/health:
@@ -47,7 +79,7 @@ router.get('/health', (req, res) => {
     message: 'SnackTrack API is running successfully',
     timestamp: new Date().toISOString(),
     version: '1.0.0',
-    environment: process.env.NODE_ENV || 'development'
+    environment: settings.ENVIRONMENT
   });
 });
 
@@ -82,35 +114,7 @@ router.get('/', (req, res) => {
     message: 'Welcome to SnackTrack API',
     documentation: {
       baseUrl: `${req.protocol}://${req.get('host')}/api`,
-      endpoints: {
-        users: {
-          register: 'POST /api/users/register',
-          login: 'POST /api/users/login',
-          profile: 'GET /api/users/profile',
-          healthTips: 'GET /api/users/health-tips',
-          dietaryPreferences: 'GET /api/users/dietary-preferences'
-        },
-        products: {
-          scanBarcode: 'POST /api/products/scan/barcode',
-          scanImage: 'POST /api/products/scan/image',
-          search: 'GET /api/products/search',
-          getProduct: 'GET /api/products/:id',
-          getAssessment: 'GET /api/products/:id/assessment',
-          history: 'GET /api/products/history',
-          stats: 'GET /api/products/stats',
-          categories: 'GET /api/products/categories'
-        },
-        assessments: {
-          create: 'POST /api/assessments',
-          getById: 'GET /api/assessments/:id',
-          update: 'PUT /api/assessments/:id',
-          history: 'GET /api/assessments/user/history',
-          stats: 'GET /api/assessments/user/stats',
-          delete: 'DELETE /api/assessments/:id',
-          bulk: 'POST /api/assessments/bulk'
-        },
-        health: 'GET /api/health'
-      }
+      endpoints: API_ENDPOINTS
     }
   });
 });
@@ -4,6 +4,7 @@ const productController = require('../controllers/productController');
 const { authenticateToken, optionalAuth } = require('../middlewares/authMiddleware');
 const { validateRequest } = require('../middlewares/validationMiddleware');
 const { body, query, param } = require('express-validator');
+const { RECOMMENDATIONS } = require('../config/constants');
 
 /**
  * @swagger
@@ -379,7 +380,7 @@ router.get('/history',
       .withMessage('Offset must be non-negative'),
     query('recommendation')
       .optional()
-      .isIn(['excellent', 'good', 'moderate', 'avoid'])
+      .isIn(RECOMMENDATIONS)
       .withMessage('Invalid recommendation filter')
   ],
   validateRequest,
@@ -2,12 +2,32 @@ const express = require('express');
 const router = express.Router();
 const userController = require('../controllers/userController');
 const { body } = require('express-validator');
+const { GENDERS, DIETARY_PREFERENCES, HEALTH_GOALS, ACTIVITY_LEVELS } = require('../config/constants');
 
 // Import middleware
 const { auth } = require('../middlewares/auth');
 const { adminAuth } = require('../middlewares/adminAuth');
 const upload = require('../middlewares/upload');
 
+// Static response payloads, built once instead of on every request
+const HEALTH_TIPS = Object.freeze([
+  'Drink at least 8 glasses of water daily',
+  'Include protein in every meal',
+  'Aim for 7-9 hours of sleep per night',
+  'Exercise for at least 30 minutes daily',
+  'Eat a variety of colorful fruits and vegetables'
+]);
+
+const DIETARY_PREFERENCE_OPTIONS = Object.freeze([
+  { value: 'veg', label: 'Vegetarian', description: 'No meat, fish, or poultry' },
+  { value: 'vegan', label: 'Vegan', description: 'No animal products' },
+  { value: 'keto', label: 'Ketogenic', description: 'High fat, low carb' },
+  { value: 'paleo', label: 'Paleo', description: 'Whole foods, no processed items' },
+  { value: 'gluten_free', label: 'Gluten Free', description: 'No gluten-containing grains' },
+  { value: 'dairy_free', label: 'Dairy Free', description: 'No dairy products' },
+  { value: 'none', label: 'No Restrictions', description: 'No dietary restrictions' }
+]);
+
 /**
  * 🔐 AUTHENTICATION ROUTES
  */
@@ -141,24 +161,28 @@ router.post('/register', [
     .withMessage('Weight must be between 20 and 500 kg'),
   body('gender')
     .optional()
-    .isIn(['Male', 'Female', 'Other'])
+    .isIn(GENDERS)
     .withMessage('Gender must be Male, Female, or Other'),
   body('dietary_preferences')
     .optional()
-    .isIn(['veg', 'vegan', 'keto', 'paleo', 'gluten_free', 'dairy_free', 'none'])
+    .isIn(DIETARY_PREFERENCES)
     .withMessage('Invalid dietary preference'),
   body('health_goals')
     .optional()
-    .isIn(['lose_weight', 'gain_muscle', 'maintain', 'improve_health'])
+    .isIn(HEALTH_GOALS)
     .withMessage('Invalid health goal'),
   body('activity_level')
     .optional()
-    .isIn(['sedentary', 'light', 'moderate', 'active', 'very_active'])
+    .isIn(ACTIVITY_LEVELS)
     .withMessage('Invalid activity level'),
   body('allergies')
     .optional()
-    .isArray()
-    .withMessage('Allergies must be an array')
+    .isArray({ max: 10 })
+    .withMessage('Allergies must be an array of at most 10 items'),
+  body('allergies.*')
+    .isString()
+    .isLength({ max: 50 })
+    .withMessage('Each allergy must be a string of at most 50 characters')
 ], userController.register);
 
 /**
@@ -374,24 +398,28 @@ router.put('/profile', [
     .withMessage('Weight must be between 20 and 500 kg'),
   body('gender')
     .optional()
-    .isIn(['Male', 'Female', 'Other'])
+    .isIn(GENDERS)
     .withMessage('Gender must be Male, Female, or Other'),
   body('dietary_preferences')
     .optional()
-    .isIn(['veg', 'vegan', 'keto', 'paleo', 'gluten_free', 'dairy_free', 'none'])
+    .isIn(DIETARY_PREFERENCES)
     .withMessage('Invalid dietary preference'),
   body('health_goals')
     .optional()
-    .isIn(['lose_weight', 'gain_muscle', 'maintain', 'improve_health'])
+    .isIn(HEALTH_GOALS)
     .withMessage('Invalid health goal'),
   body('activity_level')
     .optional()
-    .isIn(['sedentary', 'light', 'moderate', 'active', 'very_active'])
+    .isIn(ACTIVITY_LEVELS)
     .withMessage('Invalid activity level'),
   body('allergies')
     .optional()
-    .isArray()
-    .withMessage('Allergies must be an array'),
+    .isArray({ max: 10 })
+    .withMessage('Allergies must be an array of at most 10 items'),
+  body('allergies.*')
+    .isString()
+    .isLength({ max: 50 })
+    .withMessage('Each allergy must be a string of at most 50 characters'),
   body('phone')
     .optional()
     .isMobilePhone()
@@ -472,11 +500,16 @@ router.get('/health-metrics', auth, userController.getHealthMetrics);
  */
 
 // POST /api/users/check-compatibility
+// Send "Accept: application/x-ndjson" to stream one allergy check per line,
+// followed by a summary line
 router.post('/check-compatibility', [
   auth,
   body('ingredients')
     .isArray({ min: 1 })
-    .withMessage('Ingredients array is required and must not be empty')
+    .withMessage('Ingredients array is required and must not be empty'),
+  body('ingredients.*')
+    .isString()
+    .withMessage('Each ingredient must be a string')
 ], userController.checkProductCompatibility);
 
 /**
@@ -517,13 +550,7 @@ router.get('/health-tips', (req, res) => {
     success: true,
     message: 'Health tips retrieved successfully',
     data: {
-      tips: [
-        'Drink at least 8 glasses of water daily',
-        'Include protein in every meal',
-        'Aim for 7-9 hours of sleep per night',
-        'Exercise for at least 30 minutes daily',
-        'Eat a variety of colorful fruits and vegetables'
-      ],
+      tips: HEALTH_TIPS,
       lastUpdated: new Date()
     }
   });
@@ -535,15 +562,7 @@ router.get('/dietary-preferences', (req, res) => {
     success: true,
     message: 'Dietary preferences retrieved successfully',
     data: {
-      preferences: [
-        { value: 'veg', label: 'Vegetarian', description: 'No meat, fish, or poultry' },
-        { value: 'vegan', label: 'Vegan', description: 'No animal products' },
-        { value: 'keto', label: 'Ketogenic', description: 'High fat, low carb' },
-        { value: 'paleo', label: 'Paleo', description: 'Whole foods, no processed items' },
-        { value: 'gluten_free', label: 'Gluten Free', description: 'No gluten-containing grains' },
-        { value: 'dairy_free', label: 'Dairy Free', description: 'No dairy products' },
-        { value: 'none', label: 'No Restrictions', description: 'No dietary restrictions' }
-      ]
+      preferences: DIETARY_PREFERENCE_OPTIONS
     }
   });
 });
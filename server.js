@@ -1,7 +1,8 @@
 const app = require('./app');
-const { testConnection } = require('./config/database');
+const settings = require('./config/settings');
+const { testConnection, closeConnection } = require('./config/database');
 
-const PORT = process.env.PORT || 5000;
+const PORT = settings.PORT;
 
 /**
  * 🚀 START SERVER
@@ -18,12 +19,12 @@ const startServer = async () => {
     }
 
     // Start the server
-    app.listen(PORT, () => {
+    const server = app.listen(PORT, () => {
       console.log('🎉 SnackTrack Server Status:');
       console.log(`📡 Server running on port ${PORT}`);
-      console.log(`🌍 Environment: ${process.env.NODE_ENV || 'development'}`);
+      console.log(`🌍 Environment: ${settings.ENVIRONMENT}`);
       console.log(`🔗 API Base URL: http://localhost:${PORT}/api`);
-      console.log(`📚 API Documentation: http://localhost:${PORT}/api`);
+      console.log(`📚 API Documentation: http://localhost:${PORT}/api-docs`);
       console.log(`❤️  Health Check: http://localhost:${PORT}/api/health`);
       console.log('');
       console.log('🥗 Available User Endpoints:');
@@ -49,6 +50,11 @@ const startServer = async () => {
       console.log('=====================================');
     });
 
+    // Node's 5s keep-alive default is shorter than typical load balancer idle
+    // timeouts; headersTimeout must exceed keepAliveTimeout
+    server.keepAliveTimeout = settings.KEEP_ALIVE_TIMEOUT_MS;
+    server.headersTimeout = settings.KEEP_ALIVE_TIMEOUT_MS + 1000;
+
   } catch (error) {
     console.error('❌ Failed to start server:', error.message);
     process.exit(1);
@@ -56,15 +62,18 @@ const startServer = async () => {
 };
 
 // Handle graceful shutdown
-process.on('SIGTERM', () => {
-  console.log('👋 SIGTERM received, shutting down gracefully');
+const shutdown = async (signal) => {
+  console.log(`👋 ${signal} received, shutting down gracefully`);
+  try {
+    await closeConnection();
+  } catch (error) {
+    console.error('❌ Failed to close database pool:', error.message);
+  }
   process.exit(0);
-});
+};
 
-process.on('SIGINT', () => {
-  console.log('👋 SIGINT received, shutting down gracefully');
-  process.exit(0);
-});
+process.on('SIGTERM', () => shutdown('SIGTERM'));
+process.on('SIGINT', () => shutdown('SIGINT'));
 
 // Start the server
 startServer();
\ No newline at end of file
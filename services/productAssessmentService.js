@@ -174,6 +174,80 @@ class ProductAssessmentService {
     }
   }
 
+  /**
+   * 📦 BULK ASSESSMENT
+   * Loads the user and existing assessments with one query each and writes all
+   * new assessments with a single multi-row INSERT, instead of a lookup and an
+   * INSERT round trip per product.
+   */
+  async assessProductsForUser(products, userId, scanMethod = 'barcode') {
+    const assessments = new Map();
+    const errors = new Map();
+
+    const user = await User.findByPk(userId);
+    if (!user) {
+      products.forEach(product => errors.set(product.id, 'Assessment failed: User not found'));
+      return { assessments, errors };
+    }
+
+    const existing = await UserProductAssessment.findAll({
+      where: { user_id: userId, product_id: products.map(product => product.id) }
+    });
+
+    existing.forEach(assessment => assessments.set(assessment.product_id, assessment));
+    const pending = new Map();
+
+    for (const product of products) {
+      if (assessments.has(product.id) || pending.has(product.id)) continue;
+
+      try {
+        const assessmentData = await this.generatePersonalizedAssessment(product, user);
+        pending.set(product.id, {
+          user_id: userId,
+          product_id: product.id,
+          scan_method: scanMethod,
+          assessment_version: '1.0',
+          ...assessmentData
+        });
+      } catch (error) {
+        errors.set(product.id, `Assessment failed: ${error.message}`);
+      }
+    }
+
+    if (pending.size > 0) {
+      try {
+        const created = await UserProductAssessment.bulkCreate([...pending.values()], { validate: true });
+        created.forEach(assessment => assessments.set(assessment.product_id, assessment));
+      } catch (error) {
+        // The batch is all-or-nothing; retry row by row so one invalid or
+        // concurrently created assessment doesn't fail the whole request
+        await this.createAssessmentsIndividually(pending, assessments, errors);
+      }
+    }
+
+    return { assessments, errors };
+  }
+
+  async createAssessmentsIndividually(pending, assessments, errors) {
+    for (const [productId, row] of pending) {
+      try {
+        assessments.set(productId, await UserProductAssessment.create(row));
+      } catch (error) {
+        // Created by a concurrent request since the lookup above
+        if (error.name === 'SequelizeUniqueConstraintError') {
+          const existing = await UserProductAssessment.findOne({
+            where: { user_id: row.user_id, product_id: productId }
+          });
+          if (existing) {
+            assessments.set(productId, existing);
+            continue;
+          }
+        }
+        errors.set(productId, `Assessment failed: ${error.message}`);
+      }
+    }
+  }
+
   async generatePersonalizedAssessment(product, user) {
     const nutrition = product.nutrition;
     if (!nutrition) {
@@ -219,29 +293,19 @@ class ProductAssessmentService {
   }
 
   checkAllergies(product, user) {
-    const warnings = [];
-    const ingredients = product.ingredients?.toLowerCase() || '';
-    
-    if (user.allergies && user.allergies.length > 0) {
-      user.allergies.forEach(allergy => {
-        if (user.hasAllergy(allergy) && ingredients.includes(allergy.toLowerCase())) {
-          warnings.push({
-            allergen: allergy,
-            severity: 'high',
-            message: `Contains ${allergy} - avoid this product`
-          });
-        }
-      });
-    }
+    if (!product.ingredients) return [];
     
-    return warnings;
+    return user.findAllergensIn(product.ingredients).map(allergy => ({
+      allergen: allergy,
+      severity: 'high',
+      message: `Contains ${allergy} - avoid this product`
+    }));
   }
 
   checkDietaryCompatibility(product, user) {
     if (!product.ingredients) return true;
     
-    const ingredients = product.ingredients.toLowerCase().split(',').map(i => i.trim());
-    return user.isCompatibleWith(ingredients);
+    return user.isCompatibleWith(product.ingredients);
   }
 
   adjustForHealthGoals(score, nutrition, user) {
@@ -1,6 +1,7 @@
 const { User } = require('../models');
 const bcrypt = require('bcryptjs');
 const jwt = require('jsonwebtoken');
+const settings = require('../config/settings');
 
 class UserService {
   /**
@@ -60,8 +61,8 @@ class UserService {
   generateToken(userId) {
     return jwt.sign(
       { userId },
-      process.env.JWT_SECRET,
-      { expiresIn: process.env.JWT_EXPIRE || '30d' }
+      settings.JWT_SECRET,
+      { expiresIn: settings.JWT_EXPIRE }
     );
   }
 
@@ -226,6 +227,44 @@ class UserService {
     };
   }
 
+  /**
+   * 🎯 COMPATIBILITY METHODS
+   */
+  checkCompatibility(user, ingredients) {
+    const allergyChecks = user.checkAllergies(ingredients);
+    const dietaryCompatible = user.isCompatibleWith(ingredients);
+
+    return {
+      allergyChecks,
+      dietaryCompatible,
+      overallCompatible: !allergyChecks.some(check => check.hasAllergy) && dietaryCompatible,
+      dietaryRestrictions: user.getDietaryRestrictions()
+    };
+  }
+
+  /**
+   * Streaming variant of checkCompatibility for long ingredient lists (e.g. OCR
+   * output): yields one allergy check per ingredient, then a summary record,
+   * without building the full result list
+   */
+  *iterCompatibility(user, ingredients) {
+    let hasAllergy = false;
+
+    for (const check of user.iterAllergyChecks(ingredients)) {
+      hasAllergy = hasAllergy || check.hasAllergy;
+      yield { type: 'allergy_check', ...check };
+    }
+
+    const dietaryCompatible = user.isCompatibleWith(ingredients);
+
+    yield {
+      type: 'summary',
+      dietaryCompatible,
+      overallCompatible: !hasAllergy && dietaryCompatible,
+      dietaryRestrictions: user.getDietaryRestrictions()
+    };
+  }
+
   /**
    * 🔍 SEARCH & FILTER METHODS
    */
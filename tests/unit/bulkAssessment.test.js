@@ -0,0 +1,145 @@
+jest.mock('../../models', () => ({
+  Product: { findAll: jest.fn() },
+  NutritionFact: {},
+  User: { findByPk: jest.fn() },
+  UserProductAssessment: {
+    findAll: jest.fn(),
+    findOne: jest.fn(),
+    create: jest.fn(),
+    bulkCreate: jest.fn()
+  }
+}));
+
+const { Product, User, UserProductAssessment } = require('../../models');
+const ProductAssessmentService = require('../../services/productAssessmentService');
+const assessmentController = require('../../controllers/assessmentController');
+
+const makeProduct = (id, nutrition = {}) => ({
+  id,
+  nutrition,
+  toPublicObject: () => ({ id })
+});
+
+const makeAssessment = (row) => ({
+  ...row,
+  toSummary: () => ({ productId: row.product_id })
+});
+
+const makeResponse = () => {
+  const res = {};
+  res.status = jest.fn(() => res);
+  res.json = jest.fn(body => { res.body = body; return res; });
+  return res;
+};
+
+const createService = () => {
+  const service = new ProductAssessmentService();
+  service.generatePersonalizedAssessment = jest.fn(async (product) => {
+    if (!product.nutrition) throw new Error('Product nutrition data not available');
+    return { personalized_score: 50 };
+  });
+  return service;
+};
+
+describe('Bulk Assessment', () => {
+  beforeEach(() => {
+    User.findByPk.mockResolvedValue({ id: 'user-1' });
+    UserProductAssessment.findAll.mockResolvedValue([]);
+    UserProductAssessment.findOne.mockResolvedValue(null);
+    UserProductAssessment.create.mockImplementation(async row => makeAssessment(row));
+    UserProductAssessment.bulkCreate.mockImplementation(async rows => rows.map(makeAssessment));
+  });
+
+  describe('📦 Service', () => {
+    test('should write new assessments in one batch and keep existing ones', async () => {
+      const service = createService();
+      UserProductAssessment.findAll.mockResolvedValue([makeAssessment({ product_id: 'p1' })]);
+
+      const result = await service.assessProductsForUser(
+        [makeProduct('p1'), makeProduct('p2'), makeProduct('p3', null)],
+        'user-1',
+        'manual'
+      );
+
+      expect(UserProductAssessment.bulkCreate).toHaveBeenCalledTimes(1);
+      expect(UserProductAssessment.bulkCreate.mock.calls[0][0]).toHaveLength(1);
+      expect(result.assessments.get('p2').scan_method).toBe('manual');
+      expect(result.assessments.has('p1')).toBe(true);
+      expect(result.errors.get('p3')).toBe('Assessment failed: Product nutrition data not available');
+    });
+
+    test('should fall back to per-row inserts when the batch fails', async () => {
+      const service = createService();
+      const duplicate = Object.assign(new Error('Validation error'), { name: 'SequelizeUniqueConstraintError' });
+      const concurrent = makeAssessment({ product_id: 'p2' });
+
+      UserProductAssessment.bulkCreate.mockRejectedValue(new Error('Batch failed'));
+      UserProductAssessment.create.mockImplementation(async (row) => {
+        if (row.product_id === 'p2') throw duplicate;
+        if (row.product_id === 'p3') throw new Error('Validation max on personalized_score failed');
+        return makeAssessment(row);
+      });
+      UserProductAssessment.findOne.mockResolvedValue(concurrent);
+
+      const result = await service.assessProductsForUser(
+        [makeProduct('p1'), makeProduct('p2'), makeProduct('p3')],
+        'user-1'
+      );
+
+      expect(result.assessments.get('p1').product_id).toBe('p1');
+      expect(result.assessments.get('p2')).toBe(concurrent);
+      expect(result.errors.get('p3')).toBe('Assessment failed: Validation max on personalized_score failed');
+    });
+
+    test('should report a missing user per product', async () => {
+      const service = createService();
+      User.findByPk.mockResolvedValue(null);
+
+      const result = await service.assessProductsForUser([makeProduct('p1')], 'user-1');
+
+      expect(result.assessments.size).toBe(0);
+      expect(result.errors.get('p1')).toBe('Assessment failed: User not found');
+    });
+  });
+
+  describe('🧾 Controller', () => {
+    test('should report results and errors in request order', async () => {
+      assessmentController.assessmentService = createService();
+      // Database order differs from request order
+      Product.findAll.mockResolvedValue([makeProduct('p3'), makeProduct('p1', null), makeProduct('p2')]);
+
+      const req = {
+        body: { product_ids: ['p1', 'missing', 'p2', 'p3'], scan_method: 'barcode' },
+        user: { userId: 'user-1' }
+      };
+      const res = makeResponse();
+
+      await assessmentController.bulkAssessment(req, res);
+
+      expect(res.status).toHaveBeenCalledWith(200);
+      expect(res.body.data.assessments.map(item => item.product.id)).toEqual(['p2', 'p3']);
+      expect(res.body.data.errors).toEqual([
+        { product_id: 'p1', error: 'Assessment failed: Product nutrition data not available' },
+        { product_id: 'missing', error: 'Product not found' }
+      ]);
+      expect(res.body.data.summary).toEqual({ total: 4, successful: 2, failed: 2 });
+    });
+
+    test('should match uppercase product IDs against the lowercase ones Postgres returns', async () => {
+      assessmentController.assessmentService = createService();
+      const id = 'a3bb189e-8bf9-3888-9912-ace4e6543002';
+      Product.findAll.mockResolvedValue([makeProduct(id)]);
+
+      const req = {
+        body: { product_ids: [id.toUpperCase()], scan_method: 'barcode' },
+        user: { userId: 'user-1' }
+      };
+      const res = makeResponse();
+
+      await assessmentController.bulkAssessment(req, res);
+
+      expect(res.body.data.errors).toEqual([]);
+      expect(res.body.data.assessments.map(item => item.product.id)).toEqual([id]);
+    });
+  });
+});
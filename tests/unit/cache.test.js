@@ -0,0 +1,31 @@
+const { TTLCache } = require('../../utils/helpers/cache');
+
+describe('Cache Helpers', () => {
+  describe('🗃️ TTLCache', () => {
+    test('should return cached values until they expire', () => {
+      jest.useFakeTimers();
+      const cache = new TTLCache({ ttlMs: 1000 });
+
+      cache.set('key', { value: 1 });
+      expect(cache.get('key')).toEqual({ value: 1 });
+
+      jest.advanceTimersByTime(1001);
+      expect(cache.get('key')).toBeUndefined();
+      jest.useRealTimers();
+    });
+
+    test('should evict the least recently used entry when full', () => {
+      const cache = new TTLCache({ maxEntries: 2 });
+
+      cache.set('a', 1);
+      cache.set('b', 2);
+      cache.get('a');
+      cache.set('c', 3);
+
+      expect(cache.get('a')).toBe(1);
+      expect(cache.get('b')).toBeUndefined();
+      expect(cache.get('c')).toBe(3);
+      expect(cache.size).toBe(2);
+    });
+  });
+});
@@ -0,0 +1,39 @@
+const { getAllergenMatcher } = require('../../utils/helpers/ingredientMatcher');
+
+describe('Ingredient Matcher', () => {
+  describe('🥜 Allergen matching', () => {
+    test('should match ingredients containing or contained in an allergen', () => {
+      const matcher = getAllergenMatcher(['nuts', 'shellfish']);
+
+      expect(matcher.matches('Peanuts')).toBe(true);
+      expect(matcher.matches('nut')).toBe(true);
+      expect(matcher.matches('rice')).toBe(false);
+    });
+
+    test('should treat allergy names literally, not as patterns', () => {
+      const matcher = getAllergenMatcher(['e.g.']);
+
+      expect(matcher.matches('eggs')).toBe(false);
+      expect(matcher.matches('contains e.g. nuts')).toBe(true);
+    });
+
+    test('should find allergens in ingredient text with original casing', () => {
+      const matcher = getAllergenMatcher(['Nuts', 'milk', 'soy']);
+
+      expect(matcher.findIn('Sugar, PEANUTS, skimmed milk powder')).toEqual(['Nuts', 'milk']);
+      expect(matcher.findIn('rice, salt')).toEqual([]);
+    });
+
+    test('should reuse the compiled matcher for the same allergy list', () => {
+      expect(getAllergenMatcher(['nuts'])).toBe(getAllergenMatcher(['nuts']));
+      expect(getAllergenMatcher(null).matches('nuts')).toBe(false);
+    });
+
+    test('should not cache matchers for oversized allergy lists', () => {
+      const allergies = Array.from({ length: 200 }, (_, index) => `allergen-${index}`);
+
+      expect(getAllergenMatcher(allergies)).not.toBe(getAllergenMatcher(allergies));
+      expect(getAllergenMatcher(allergies).matches('allergen-199')).toBe(true);
+    });
+  });
+});
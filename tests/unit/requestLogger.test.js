@@ -0,0 +1,55 @@
+const { getRouteTemplate, jsonFormat } = require('../../middlewares/requestLogger');
+
+describe('Request Logger', () => {
+  describe('🧭 Route templates', () => {
+    test('should log the mounted route template instead of the raw URL', () => {
+      const req = { baseUrl: '/api/products', route: { path: '/:id' }, originalUrl: '/api/products/42' };
+
+      expect(getRouteTemplate(req)).toBe('/api/products/:id');
+    });
+
+    test('should not reuse a template computed after baseUrl was reset', () => {
+      const route = { path: '/:id' };
+
+      // Error handler path: Express has restored baseUrl but kept req.route
+      expect(getRouteTemplate({ baseUrl: '', route })).toBe('/:id');
+      expect(getRouteTemplate({ baseUrl: '/api/products', route })).toBe('/api/products/:id');
+    });
+
+    test('should report requests that matched no route', () => {
+      expect(getRouteTemplate({ baseUrl: '', originalUrl: '/missing' })).toBe('unmatched');
+    });
+  });
+
+  describe('🧾 JSON format', () => {
+    const tokens = {
+      date: () => '2024-01-01T00:00:00.000Z',
+      method: () => 'GET',
+      route: () => '/api/products/:id',
+      status: () => '200',
+      res: () => undefined,
+      'response-time': () => '1.234',
+      'remote-addr': () => '127.0.0.1',
+      referrer: () => undefined,
+      'user-agent': () => 'curl/8.0 "quoted"'
+    };
+
+    test('should emit one parseable JSON record per request', () => {
+      const line = jsonFormat(tokens, {}, {});
+
+      expect(line.includes('\n')).toBe(false);
+      expect(JSON.parse(line)).toEqual({
+        time: '2024-01-01T00:00:00.000Z',
+        level: 'info',
+        method: 'GET',
+        route: '/api/products/:id',
+        status: 200,
+        contentLength: null,
+        responseTimeMs: 1.234,
+        remoteAddr: '127.0.0.1',
+        referrer: null,
+        userAgent: 'curl/8.0 "quoted"'
+      });
+    });
+  });
+});
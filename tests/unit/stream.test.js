@@ -0,0 +1,113 @@
+const http = require('http');
+const { wantsNdjson, writeNdjson } = require('../../utils/helpers/stream');
+
+/**
+ * Serve a single NDJSON response from a real http server. Mirrors the
+ * controller: if streaming fails before anything was sent, reply with a
+ * JSON 400 instead.
+ */
+const startServer = (createItems) => new Promise((resolve) => {
+  let settle;
+  const settled = new Promise(done => { settle = done; });
+
+  const server = http.createServer((req, res) => {
+    res.status = (code) => { res.statusCode = code; return res; };
+    res.set = (name, value) => { res.setHeader(name, value); return res; };
+
+    writeNdjson(res, createItems())
+      .then(() => settle({ error: null }))
+      .catch((error) => {
+        settle({ error });
+        if (res.headersSent) return res.destroy(error);
+        res.writeHead(400, { 'Content-Type': 'application/json' });
+        res.end(JSON.stringify({ success: false, message: error.message }));
+      });
+  });
+
+  server.listen(0, () => resolve({
+    port: server.address().port,
+    settled,
+    close: () => new Promise(done => server.close(done))
+  }));
+});
+
+const fetchResponse = (port) => new Promise((resolve, reject) => {
+  http.get({ port }, (res) => {
+    let body = '';
+    res.setEncoding('utf8');
+    res.on('data', chunk => { body += chunk; });
+    res.on('end', () => resolve({ status: res.statusCode, type: res.headers['content-type'], body }));
+  }).on('error', reject);
+});
+
+describe('Stream Helpers', () => {
+  describe('🌊 NDJSON responses', () => {
+    test('should write one JSON line per item and end the response', async () => {
+      const server = await startServer(() => [{ ingredient: 'milk', hasAllergy: true }, { type: 'summary' }]);
+
+      const response = await fetchResponse(server.port);
+      await server.close();
+
+      expect(response.status).toBe(200);
+      expect(response.type).toBe('application/x-ndjson');
+      expect(response.body).toBe('{"ingredient":"milk","hasAllergy":true}\n{"type":"summary"}\n');
+    });
+
+    test('should write every item of a large stream', async () => {
+      const server = await startServer(() => Array.from({ length: 20000 }, (_, index) => ({ index })));
+
+      const response = await fetchResponse(server.port);
+      await server.close();
+
+      const lines = response.body.trim().split('\n');
+      expect(lines).toHaveLength(20000);
+      expect(JSON.parse(lines[19999])).toEqual({ index: 19999 });
+    });
+
+    test('should stop iterating and release the source when the client disconnects', async () => {
+      let closed = false;
+      const server = await startServer(function* () {
+        try {
+          for (let index = 0; ; index++) {
+            yield { index, padding: 'x'.repeat(200) };
+          }
+        } finally {
+          closed = true;
+        }
+      });
+
+      const request = http.get({ port: server.port }, (res) => {
+        res.once('data', () => request.destroy());
+      });
+      request.on('error', () => {});
+
+      const { error } = await server.settled;
+      await server.close();
+
+      expect(error === null).toBe(false);
+      expect(closed).toBe(true);
+    });
+
+    test('should leave the response usable when the first item fails', async () => {
+      const server = await startServer(function* () {
+        throw new Error('Invalid ingredient');
+      });
+
+      const response = await fetchResponse(server.port);
+      await server.close();
+
+      expect(response.status).toBe(400);
+      expect(response.type).toBe('application/json');
+      expect(JSON.parse(response.body).message).toBe('Invalid ingredient');
+    });
+
+    test('should only stream when NDJSON is explicitly accepted', () => {
+      const request = (accepted) => ({
+        accepts: (types) => types.find(type => type === accepted) || types[0]
+      });
+
+      expect(wantsNdjson(request('application/x-ndjson'))).toBe(true);
+      expect(wantsNdjson(request('*/*'))).toBe(false);
+    });
+  });
+});
@@ -0,0 +1,36 @@
+const { User } = require('../../models');
+
+// Built, never saved: these model methods need no database connection
+const buildUser = (attributes) => User.build({
+  name: 'Test User',
+  email: 'test@example.com',
+  password: 'Test123!@#',
+  ...attributes
+});
+
+describe('User Allergy Checks', () => {
+  describe('🥜 Ingredient lists', () => {
+    test('should check an ingredient list for allergies in one pass', () => {
+      const user = buildUser({ allergies: ['nuts', 'shellfish'] });
+
+      expect(user.checkAllergies(['Peanuts', 'Rice', 'shellfish extract'])).toEqual([
+        { ingredient: 'Peanuts', hasAllergy: true },
+        { ingredient: 'Rice', hasAllergy: false },
+        { ingredient: 'shellfish extract', hasAllergy: true }
+      ]);
+    });
+
+    test('should yield the same checks lazily', () => {
+      const user = buildUser({ allergies: ['nuts', 'shellfish'] });
+      const ingredients = ['Peanuts', 'Rice', 'shellfish extract'];
+
+      expect([...user.iterAllergyChecks(ingredients)]).toEqual(user.checkAllergies(ingredients));
+    });
+
+    test('should report no allergies for a user without any', () => {
+      const user = buildUser({ allergies: [] });
+
+      expect(user.checkAllergies(['Peanuts'])).toEqual([{ ingredient: 'Peanuts', hasAllergy: false }]);
+    });
+  });
+});
@@ -0,0 +1,56 @@
+/**
+ * 🗃️ CACHE UTILITIES
+ * In-memory cache helpers for memoizing repeatable, deterministic results
+ */
+
+/**
+ * Bounded TTL cache
+ * Entries expire after ttlMs; once maxEntries is reached the least recently
+ * used entry is evicted (Map keeps insertion order, hits are re-inserted).
+ */
+class TTLCache {
+  constructor({ maxEntries = 1000, ttlMs = 60 * 60 * 1000 } = {}) {
+    this.maxEntries = maxEntries;
+    this.ttlMs = ttlMs;
+    this.entries = new Map();
+  }
+
+  get(key) {
+    const entry = this.entries.get(key);
+    if (!entry) return undefined;
+
+    if (entry.expiresAt <= Date.now()) {
+      this.entries.delete(key);
+      return undefined;
+    }
+
+    // Refresh recency
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    return entry.value;
+  }
+
+  set(key, value) {
+    this.entries.delete(key);
+
+    if (this.entries.size >= this.maxEntries) {
+      const oldestKey = this.entries.keys().next().value;
+      this.entries.delete(oldestKey);
+    }
+
+    this.entries.set(key, { value, expiresAt: Date.now() + this.ttlMs });
+    return value;
+  }
+
+  clear() {
+    this.entries.clear();
+  }
+
+  get size() {
+    return this.entries.size;
+  }
+}
+
+module.exports = {
+  TTLCache
+};
@@ -0,0 +1,67 @@
+const { TTLCache } = require('./cache');
+
+/**
+ * 🔍 INGREDIENT MATCHING UTILITIES
+ * Compiled allergen matchers, cached per allergy list so repeated scans by the
+ * same user reuse one matcher instead of re-lowercasing and rescanning the
+ * allergy list for every ingredient.
+ */
+
+const escapeRegExp = (text) => text.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+
+// Keyed by the user's allergy list; users with identical lists share a matcher
+const matcherCache = new TTLCache({ maxEntries: 1024, ttlMs: 24 * 60 * 60 * 1000 });
+
+// Routes cap profiles at 10 short allergies; anything longer (e.g. stored
+// before validation) is compiled per call so it can't pin memory in the cache
+const MAX_CACHED_SIGNATURE_LENGTH = 1024;
+
+const buildAllergenMatcher = (allergyList) => {
+  // Copy so later changes to the caller's array can't alter a cached matcher
+  const allergies = [...allergyList];
+  const allergens = allergies.map(allergy => allergy.toLowerCase());
+  const pattern = allergens.length > 0
+    ? new RegExp(allergens.map(escapeRegExp).join('|'))
+    : null;
+
+  return {
+    /**
+     * Whether an ingredient name contains an allergen, or is itself part of
+     * one (e.g. "nut" against an allergy to "nuts")
+     */
+    matches(ingredient) {
+      if (!pattern) return false;
+
+      const name = ingredient.toLowerCase();
+      return pattern.test(name) || allergens.some(allergen => allergen.includes(name));
+    },
+
+    /**
+     * Allergies (as originally written) that occur in a block of ingredient text.
+     * One regex pass rules out the common no-match case before per-allergen checks.
+     */
+    findIn(text) {
+      if (!pattern) return [];
+
+      const lowered = text.toLowerCase();
+      if (!pattern.test(lowered)) return [];
+
+      return allergies.filter((allergy, index) => lowered.includes(allergens[index]));
+    }
+  };
+};
+
+const getAllergenMatcher = (allergies) => {
+  const list = allergies || [];
+  const signature = JSON.stringify(list);
+
+  if (signature.length > MAX_CACHED_SIGNATURE_LENGTH) {
+    return buildAllergenMatcher(list);
+  }
+
+  return matcherCache.get(signature) || matcherCache.set(signature, buildAllergenMatcher(list));
+};
+
+module.exports = {
+  getAllergenMatcher
+};
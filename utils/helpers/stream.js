@@ -0,0 +1,54 @@
+const { Readable } = require('stream');
+const { pipeline } = require('stream/promises');
+
+/**
+ * 🌊 STREAMING UTILITIES
+ * Helpers for writing large result sets incrementally instead of buffering
+ * the whole response body
+ */
+
+const NDJSON_CONTENT_TYPE = 'application/x-ndjson';
+
+/**
+ * Whether the client asked for newline-delimited JSON. A wildcard Accept
+ * header still resolves to regular JSON, so streaming is strictly opt-in.
+ */
+const wantsNdjson = (req) => {
+  return req.accepts(['application/json', NDJSON_CONTENT_TYPE]) === NDJSON_CONTENT_TYPE;
+};
+
+function* toNdjsonLines(items) {
+  for (const item of items) {
+    yield `${JSON.stringify(item)}\n`;
+  }
+}
+
+/**
+ * Write each item of an iterable as one JSON line. The first item is pulled
+ * before any header is set: pipeline() destroys the response when its source
+ * throws, so an early failure must surface while the caller can still reply
+ * with a regular JSON error. After that, pipeline() applies backpressure and,
+ * if the client disconnects, closes the iterator so nothing keeps the
+ * remaining items alive.
+ */
+const writeNdjson = async (res, items, statusCode = 200) => {
+  const iterator = items[Symbol.iterator]();
+  const first = iterator.next();
+
+  function* remaining() {
+    if (first.done) return;
+    yield first.value;
+    yield* iterator;
+  }
+
+  res.status(statusCode);
+  res.set('Content-Type', NDJSON_CONTENT_TYPE);
+
+  await pipeline(Readable.from(toNdjsonLines(remaining())), res);
+};
+
+module.exports = {
+  NDJSON_CONTENT_TYPE,
+  wantsNdjson,
+  writeNdjson
+};
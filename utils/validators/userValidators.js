@@ -1,4 +1,5 @@
 const { body, param, query } = require('express-validator');
+const { DIETARY_PREFERENCES, HEALTH_GOALS, ACTIVITY_LEVELS } = require('../../config/constants');
 
 /**
  * 👤 USER VALIDATION RULES
@@ -61,17 +62,17 @@ const validateUserRegistration = [
     
   body('health_goals')
     .optional()
-    .isIn(['lose_weight', 'gain_muscle', 'maintain', 'improve_health'])
+    .isIn(HEALTH_GOALS)
     .withMessage('Health goal must be one of: lose_weight, gain_muscle, maintain, improve_health'),
     
   body('activity_level')
     .optional()
-    .isIn(['sedentary', 'light', 'moderate', 'active', 'very_active'])
+    .isIn(ACTIVITY_LEVELS)
     .withMessage('Activity level must be one of: sedentary, light, moderate, active, very_active'),
     
   body('dietary_preferences')
     .optional()
-    .isIn(['veg', 'vegan', 'keto', 'paleo', 'gluten_free', 'dairy_free', 'none'])
+    .isIn(DIETARY_PREFERENCES)
     .withMessage('Dietary preference must be one of: veg, vegan, keto, paleo, gluten_free, dairy_free, none'),
     
   body('allergies')
@@ -146,17 +147,17 @@ const validateProfileUpdate = [
     
   body('health_goals')
     .optional()
-    .isIn(['lose_weight', 'gain_muscle', 'maintain', 'improve_health'])
+    .isIn(HEALTH_GOALS)
     .withMessage('Health goal must be one of: lose_weight, gain_muscle, maintain, improve_health'),
     
   body('activity_level')
     .optional()
-    .isIn(['sedentary', 'light', 'moderate', 'active', 'very_active'])
+    .isIn(ACTIVITY_LEVELS)
     .withMessage('Activity level must be one of: sedentary, light, moderate, active, very_active'),
     
   body('dietary_preferences')
     .optional()
-    .isIn(['veg', 'vegan', 'keto', 'paleo', 'gluten_free', 'dairy_free', 'none'])
+    .isIn(DIETARY_PREFERENCES)
     .withMessage('Dietary preference must be one of: veg, vegan, keto, paleo, gluten_free, dairy_free, none'),
     
   body('allergies')
@@ -194,12 +195,12 @@ const validatePasswordChange = [
 const validateUserSearch = [
   query('health_goal')
     .optional()
-    .isIn(['lose_weight', 'gain_muscle', 'maintain', 'improve_health'])
+    .isIn(HEALTH_GOALS)
     .withMessage('Health goal filter must be valid'),
     
   query('dietary_preference')
     .optional()
-    .isIn(['veg', 'vegan', 'keto', 'paleo', 'gluten_free', 'dairy_free', 'none'])
+    .isIn(DIETARY_PREFERENCES)
     .withMessage('Dietary preference filter must be valid'),
     
   query('allergy')